@@ -4,32 +4,93 @@ PDF Splitter - A tool that splits PDF pages into left and right halves, while pr
 Useful for old scans of books where each page contains two actual pages.
 """
 
+import copy
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
-import PyPDF2
+import pikepdf
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
-from PyPDF2.generic import ArrayObject, FloatObject, NameObject
 
 app = typer.Typer(help="Split PDF pages into left and right halves while preserving annotations.")
 console = Console()
 
+# Default number of worker processes used when splitting a directory of PDFs
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Pages with at least this many annotations are filtered with NumPy
+NUMPY_MIN_ANNOTS = 16
+
+# Decimal places kept for /MediaBox coordinates (1/1000 pt)
+MEDIABOX_DECIMALS = 3
+
+# Name keys looked up on every page
+ANNOTS = pikepdf.Name('/Annots')
+MEDIABOX = pikepdf.Name('/MediaBox')
+PARENT = pikepdf.Name('/Parent')
+RECT = pikepdf.Name('/Rect')
+
+def get_annot_x_extent(annot) -> Optional[Tuple[float, float]]:
+    """Return an annotation's (x_left, x_right) from its /Rect, or None if unusable.
+    
+    Entries that are not dictionaries (such as nulls left by deleted
+    annotations), missing or short rects and non-numeric coordinates all
+    return None, so malformed annotations are skipped without raising.
+    pikepdf resolves indirect references itself and returns PDF numbers as
+    int or Decimal.
+    """
+    if not isinstance(annot, pikepdf.Dictionary):
+        return None
+    rect = annot.get(RECT)
+    if not isinstance(rect, pikepdf.Array) or len(rect) < 4:
+        return None
+    x_left = rect[0]
+    x_right = rect[2]
+    if not isinstance(x_left, (int, Decimal)) or not isinstance(x_right, (int, Decimal)):
+        return None
+    return float(x_left), float(x_right)
+
+def make_progress(**kwargs):
+    """Create the progress bar used for both pages and files.
+    
+    rich.progress is imported on first use rather than at module load, so
+    --help and early validation errors do not pay for it (NumPy is deferred
+    the same way in filter_annots_vectorized).
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeRemainingColumn(),
+        **kwargs
+    )
+
 class PDFProcessor:
     """Handles the processing of PDF files, splitting each page into left and right halves."""
     
-    def __init__(self, input_path: Path, output_path: Path):
+    def __init__(self, input_path: Path, output_path: Path, compress_streams: bool = True):
         """Initialize the processor with input and output paths.
         
         Args:
             input_path: Path to the input PDF file
             output_path: Path where the processed PDF will be saved
+            compress_streams: If False, write uncompressed streams and object
+                streams as-is, trading a much larger file for a faster write
         """
         self.input_path = input_path
         self.output_path = output_path
+        self.compress_streams = compress_streams
+        
+        # /MediaBox arrays already built for this document, keyed by coordinates
+        self._mediaboxes = {}
         
         # Create output directory if it doesn't exist
         os.makedirs(output_path.parent, exist_ok=True)
@@ -41,22 +102,208 @@ class PDFProcessor:
         Some PDFs have larger MediaBoxes with white margins defined by the CropBox.
         
         Args:
-            page: A PDF page object from PyPDF2
+            page: A PDF page object from pikepdf
             
         Returns:
             tuple: (width, height, x_offset, y_offset) of the page's visible area
         """
-        if '/CropBox' in page:
-            box = page.cropbox
-        else:
-            box = page.mediabox
+        # qpdf resolves the CropBox in C++, falling back to the MediaBox when
+        # the page has none, and Rectangle already exposes floats
+        box = pikepdf.Rectangle(page.cropbox)
+        return box.width, box.height, box.llx, box.lly
+
+    def get_mediabox(self, x0: float, y0: float, x1: float, y1: float):
+        """Return a /MediaBox array for the given coordinates, reusing an earlier one if possible.
+        
+        Scanned books usually have the same page size throughout, so every left
+        half (and every right half) can share one array instead of building a
+        new one per page. The arrays are never modified after creation.
+        
+        Coordinates are rounded to MEDIABOX_DECIMALS places, which keeps the
+        written numbers short (264.033 rather than 264.033333) and lets
+        boxes that differ only by float noise share an array.
+        """
+        key = (round(x0, MEDIABOX_DECIMALS), round(y0, MEDIABOX_DECIMALS),
+               round(x1, MEDIABOX_DECIMALS), round(y1, MEDIABOX_DECIMALS))
+        box = self._mediaboxes.get(key)
+        if box is None:
+            box = self._mediaboxes[key] = pikepdf.Array(key)
+        return box
+
+    def filter_annots_vectorized(self, annots, x_offset: float, mid: float, right_edge: float):
+        """Select the annotations overlapping each half of a page using NumPy masks.
+        
+        Annotations without a usable /Rect, and entries that are not
+        dictionaries, are dropped, as in the per-annotation loop.
+        
+        Args:
+            annots: The page's /Annots array
+            x_offset: Left edge of the page's visible area
+            mid: x coordinate where the page is split
+            right_edge: Right edge of the page's visible area
+            
+        Returns:
+            tuple: (left_annots, right_annots) as lists of annotations
+        """
+        # NumPy is only needed for annotation-heavy pages, so it is imported
+        # here rather than at module load, like rich.progress in make_progress
+        import numpy as np
+
+        # A plain list can be indexed with NumPy integers; a pikepdf.Array cannot
+        annots = list(annots)
+
+        def iter_x_extents():
+            for annot in annots:
+                extent = get_annot_x_extent(annot)
+                if extent is None:
+                    yield np.nan
+                    yield np.nan
+                else:
+                    yield from extent
+
+        # Fill the array straight from the rects in one pass
+        x_extents = np.fromiter(iter_x_extents(), dtype=np.float64, count=2 * len(annots)).reshape(-1, 2)
+
+        x_left = x_extents[:, 0]
+        x_right = x_extents[:, 1]
+        left_mask = (x_right > x_offset) & (x_left < mid)
+        right_mask = (x_right > mid) & (x_left < right_edge)
+
+        left_annots = [annots[i] for i in np.nonzero(left_mask)[0]]
+        right_annots = [annots[i] for i in np.nonzero(right_mask)[0]]
+        return left_annots, right_annots
+
+    def partition_annots(self, annots, x_offset: float, mid: float, right_edge: float):
+        """Sort a page's annotations into the halves they overlap, in a single pass.
         
-        width = float(box.width)
-        height = float(box.height)
-        x_offset = float(box.left)
-        y_offset = float(box.bottom)
+        Each annotation's /Rect is read once. An annotation spanning the split
+        goes to both halves; one without a usable /Rect, or an entry that is
+        not a dictionary, is dropped.
         
-        return width, height, x_offset, y_offset
+        Args:
+            annots: The page's /Annots array
+            x_offset: Left edge of the page's visible area
+            mid: x coordinate where the page is split
+            right_edge: Right edge of the page's visible area
+            
+        Returns:
+            tuple: (left_annots, right_annots) as lists of annotations
+        """
+        left_annots = []
+        right_annots = []
+        for annot in annots:
+            extent = get_annot_x_extent(annot)
+            if extent is None:
+                continue
+            x_left, x_right = extent
+            if x_right > x_offset and x_left < mid:
+                left_annots.append(annot)
+            if x_right > mid and x_left < right_edge:
+                right_annots.append(annot)
+
+        return left_annots, right_annots
+
+    def split_page(self, pdf, page, page_num: int, quiet: bool = False):
+        """Split a page into left and right halves, in place.
+        
+        The page itself becomes the left half and a new copy of it becomes the
+        right half. The copy is not added to the page tree; process_pdf does
+        that for all pages at once.
+        
+        Args:
+            pdf: The pikepdf document being split
+            page: The page to split
+            page_num: 1-based page number in the input, used in warnings
+            quiet: If True, suppress warning messages
+            
+        Returns:
+            tuple: (left_page, right_page)
+        """
+        width, height, x_offset, y_offset = self.get_page_dimensions(page)
+        mid = x_offset + width/2
+        right_edge = x_offset + width
+        top = y_offset + height
+        annots = page.obj.get(ANNOTS)
+
+        # Shallow copy the page dictionary; both halves share the content
+        # stream and resources
+        left_page = page
+        right_page = pikepdf.Page(pdf.make_indirect(copy.copy(page.obj)))
+
+        # Create left and right halves
+        left_page.obj[MEDIABOX] = self.get_mediabox(x_offset, y_offset, mid, top)
+        right_page.obj[MEDIABOX] = self.get_mediabox(mid, y_offset, right_edge, top)
+
+        # Pages without annotations need nothing beyond the two mediaboxes;
+        # otherwise both copies start with the page's /Annots array
+        if not annots:
+            return left_page, right_page
+
+        # Annotation-heavy pages are filtered with NumPy. Malformed annotations
+        # are skipped by both filters; only a damaged object that qpdf cannot
+        # read leaves the page's annotations on both halves
+        try:
+            if len(annots) >= NUMPY_MIN_ANNOTS:
+                partition = self.filter_annots_vectorized(annots, x_offset, mid, right_edge)
+            else:
+                partition = self.partition_annots(annots, x_offset, mid, right_edge)
+        except pikepdf.PdfError as e:
+            if not quiet:
+                console.print(f"[yellow]Warning: Could not process annotations on page {page_num}: {e}[/yellow]")
+            return left_page, right_page
+
+        # An annotation may belong to only one page, so one that crosses the
+        # split gets its own copy on the right half. Annotations on the right
+        # half point their /P back at it rather than at the original page
+        left_annots, right_annots = partition
+        crossing = {id(annot) for annot in left_annots}
+        for i, annot in enumerate(right_annots):
+            if id(annot) in crossing:
+                annot = right_annots[i] = pdf.make_indirect(copy.copy(annot))
+            if '/P' in annot:
+                annot.P = right_page.obj
+
+        # Update or remove each half's annotations list
+        for half, new_annots in zip((left_page, right_page), (left_annots, right_annots)):
+            if new_annots:
+                half.obj[ANNOTS] = pikepdf.Array(new_annots)
+            else:
+                del half.obj[ANNOTS]
+
+        return left_page, right_page
+
+    def remap_page_labels(self, node) -> bool:
+        """Move page label ranges to the split page indices, in place.
+        
+        Both halves of input page k land at output indices 2k and 2k + 1, so
+        every key in the /PageLabels number tree (and every /Limits bound) is
+        doubled. Each label range then starts at the left half of the page it
+        used to start at, and the halves are numbered consecutively.
+        
+        Args:
+            node: A node of the /PageLabels number tree
+            
+        Returns:
+            bool: False if the tree is malformed and was only partly remapped
+        """
+        if not isinstance(node, pikepdf.Dictionary):
+            return False
+        nums = node.get('/Nums')
+        if nums is not None:
+            if not isinstance(nums, pikepdf.Array) or len(nums) % 2:
+                return False
+            keys = [nums[i] for i in range(0, len(nums), 2)]
+            if not all(isinstance(key, int) for key in keys):
+                return False
+            node.Nums = pikepdf.Array([
+                2 * value if i % 2 == 0 else value for i, value in enumerate(nums)
+            ])
+        limits = node.get('/Limits')
+        if limits is not None:
+            if not isinstance(limits, pikepdf.Array) or not all(isinstance(bound, int) for bound in limits):
+                return False
+            node.Limits = pikepdf.Array([2 * bound for bound in limits])
+        return all(self.remap_page_labels(kid) for kid in node.get('/Kids', ()))
 
     def process_pdf(self, quiet: bool = False):
         """Process the PDF file, splitting each page into left and right halves.
@@ -65,120 +312,179 @@ class PDFProcessor:
             quiet: If True, suppress progress messages
         
         This method:
-        1. Reads the input PDF
+        1. Opens the input PDF
         2. For each page:
            - Creates a left half with the left portion of content
            - Creates a right half with the right portion of content
            - Preserves and adjusts annotations for each half
         3. Saves the processed PDF with twice as many pages
+        
+        Pages are split one at a time, in order. qpdf documents are not
+        thread-safe, so parallelism happens across files (see split_pdfs).
+        
+        The input document is edited in place rather than copied into a new
+        one, so stream data stays in the input file until it is streamed to
+        the output on save and memory use does not grow with file size.
         """
-        reader = PyPDF2.PdfReader(self.input_path)
-        writer = PyPDF2.PdfWriter()
-        total_pages = len(reader.pages)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn()
-        ) as progress:
-            task = progress.add_task("Processing pages", total=total_pages)
-            for page_num, page in enumerate(reader.pages, 1):
-                width, height, x_offset, y_offset = self.get_page_dimensions(page)
-                
-                # Create left half
-                left_page = PyPDF2.PdfWriter()
-                left_page.add_page(page)
-                left_page.pages[0].mediabox.lower_left = (x_offset, y_offset)
-                left_page.pages[0].mediabox.upper_right = (x_offset + width/2, y_offset + height)
-                
-                # Handle annotations for left page
-                if '/Annots' in left_page.pages[0]:
-                    annots = left_page.pages[0]['/Annots']
-                    if annots:
-                        new_annots = []
-                        for annot in annots:
-                            try:
-                                # Handle indirect object references
-                                if hasattr(annot, 'get_object'):
-                                    annot = annot.get_object()
-                                
-                                # Check if annotation overlaps with left half
-                                if '/Rect' in annot:
-                                    rect = annot['/Rect']
-                                    x_left = float(rect[0])
-                                    x_right = float(rect[2])
-                                    if x_right > x_offset and x_left < x_offset + width/2:
-                                        new_annots.append(annot)
-                            except Exception as e:
-                                if not quiet:
-                                    console.print(f"[yellow]Warning: Could not process annotation on page {page_num}: {e}[/yellow]")
-                                continue
-                        
-                        # Update or remove annotations list
-                        if new_annots:
-                            left_page.pages[0][NameObject('/Annots')] = ArrayObject(new_annots)
-                        elif '/Annots' in left_page.pages[0]:
-                            del left_page.pages[0]['/Annots']
-
-                writer.add_page(left_page.pages[0])
-
-                # Create right half
-                right_page = PyPDF2.PdfWriter()
-                right_page.add_page(page)
-                right_page.pages[0].mediabox.lower_left = (x_offset + width/2, y_offset)
-                right_page.pages[0].mediabox.upper_right = (x_offset + width, y_offset + height)
-
-                # Handle annotations for right page
-                if '/Annots' in right_page.pages[0]:
-                    annots = right_page.pages[0]['/Annots']
-                    if annots:
-                        new_annots = []
-                        for annot in annots:
-                            try:
-                                # Handle indirect object references
-                                if hasattr(annot, 'get_object'):
-                                    annot = annot.get_object()
-                                
-                                # Check if annotation overlaps with right half
-                                if '/Rect' in annot:
-                                    rect = annot['/Rect']
-                                    x_left = float(rect[0])
-                                    x_right = float(rect[2])
-                                    if x_right > x_offset + width/2 and x_left < x_offset + width:
-                                        new_annots.append(annot)
-                            except Exception as e:
-                                if not quiet:
-                                    console.print(f"[yellow]Warning: Could not process annotation on page {page_num}: {e}[/yellow]")
-                                continue
-                        
-                        # Update or remove annotations list
-                        if new_annots:
-                            right_page.pages[0][NameObject('/Annots')] = ArrayObject(new_annots)
-                        elif '/Annots' in right_page.pages[0]:
-                            del right_page.pages[0]['/Annots']
-
-                writer.add_page(right_page.pages[0])
-
-        # Save the processed PDF
-        with open(self.output_path, "wb") as output_file:
-            writer.write(output_file)
-
-def process_pdf(input_path: str, output_path: str) -> None:
+        self._mediaboxes.clear()
+        # Splitting a file onto itself needs pikepdf to hold the input in memory
+        overwrite = self.input_path.resolve() == self.output_path.resolve()
+        with pikepdf.open(self.input_path, allow_overwriting_input=overwrite) as pdf:
+            # Building the page list pushes inherited attributes down onto each
+            # page. Pages are then visited lazily rather than copied into a list
+            total_pages = len(pdf.pages)
+            page_tree = pdf.Root.Pages
+            kids = []
+
+            with make_progress(
+                transient=True,
+                refresh_per_second=10,
+                disable=quiet
+            ) as progress:
+                task = progress.add_task("Processing pages", total=total_pages)
+                # Advance the bar in steps of roughly 0.5% rather than per page
+                update_every = max(1, total_pages // 200)
+                pages_since_update = 0
+                for page_num, page in enumerate(pdf.pages, 1):
+                    for half in self.split_page(pdf, page, page_num, quiet):
+                        half.obj[PARENT] = page_tree
+                        kids.append(half.obj)
+                    pages_since_update += 1
+                    if pages_since_update == update_every:
+                        progress.update(task, advance=update_every)
+                        pages_since_update = 0
+                progress.update(task, completed=total_pages)
+
+            # Replace the page tree with a flat list of halves in one step, since
+            # each pdf.pages insert costs O(n). pdf.pages is stale after this
+            page_tree.Kids = pikepdf.Array(kids)
+            page_tree.Count = len(kids)
+
+            # Page labels refer to the original page indices
+            if '/PageLabels' in pdf.Root:
+                if not self.remap_page_labels(pdf.Root.PageLabels):
+                    if not quiet:
+                        console.print("[yellow]Warning: Could not remap malformed page labels; dropping them[/yellow]")
+                    del pdf.Root.PageLabels
+
+            # Save the processed PDF. Streams are not decoded, so already
+            # filtered content and image data are copied through unchanged
+            pdf.save(
+                self.output_path,
+                linearize=False,
+                object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                compress_streams=self.compress_streams,
+                stream_decode_level=pikepdf.StreamDecodeLevel.none,
+            )
+
+def process_pdf(input_path: str, output_path: str, compress_streams: bool = True) -> None:
     """Process a single PDF file."""
     try:
-        processor = PDFProcessor(input_path, output_path)
+        processor = PDFProcessor(Path(input_path), Path(output_path), compress_streams)
         processor.process_pdf()
         console.print(f"[green]Successfully processed {input_path} -> {output_path}[/green]")
     except Exception as e:
         console.print(f"[red]Error processing {input_path}: {str(e)}[/red]")
         raise typer.Exit(1)
 
+def _split_one(job: Tuple[Path, Path, bool]) -> Optional[str]:
+    """Split a single PDF, returning an error message rather than raising.
+    
+    Runs either in this process or in a worker, so one bad file does not stop
+    the rest of a batch.
+    """
+    input_path, output_path, compress_streams = job
+    try:
+        PDFProcessor(input_path, output_path, compress_streams).process_pdf(quiet=True)
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return None
+
+def _split_in_pool(jobs: List[Tuple[Path, Path, bool]], workers: int) -> Iterator[Tuple[Path, Optional[str]]]:
+    """Split jobs across a process pool, yielding (input_path, error) as each file finishes."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_split_one, job): job[0] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                error = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool when a worker dies mid-file
+                error = str(e) or type(e).__name__
+            yield futures[future], error
+
+def get_output_paths(inputs: List[Path], output_dir: Path) -> List[Path]:
+    """Choose a distinct "split_" output path in output_dir for each input.
+    
+    Inputs from different directories can share a file name. Those get the
+    parent directory's name added ("split_<dir>_<name>"), and any name still
+    taken after that gets a counter ("split_<dir>_<name>_2.pdf"), so no two
+    jobs ever write the same file.
+    """
+    names = [f"split_{pdf.name}" for pdf in inputs]
+    counts = Counter(names)
+    names = [
+        f"split_{pdf.parent.name}_{pdf.name}" if counts[name] > 1 else name
+        for pdf, name in zip(inputs, names)
+    ]
+
+    taken = set()
+    output_paths = []
+    for name in names:
+        candidate = name
+        counter = 2
+        while candidate in taken:
+            stem, suffix = os.path.splitext(name)
+            candidate = f"{stem}_{counter}{suffix}"
+            counter += 1
+        taken.add(candidate)
+        output_paths.append(output_dir / candidate)
+    return output_paths
+
+def split_pdfs(inputs: List[Path], output_dir: Path, workers: int = DEFAULT_WORKERS, compress_streams: bool = True) -> None:
+    """Split several PDFs, writing each to the output directory with a "split_" prefix.
+    
+    With a single worker the files are split one after another in this
+    process, reusing the already imported modules and console. With more,
+    they are fanned out to a process pool and reported as each one finishes.
+    """
+    # The same file listed twice is only split once
+    seen = set()
+    unique_inputs = []
+    for pdf in inputs:
+        if pdf.resolve() not in seen:
+            seen.add(pdf.resolve())
+            unique_inputs.append(pdf)
+    output_paths = get_output_paths(unique_inputs, output_dir)
+    jobs = [(pdf, output_path, compress_streams) for pdf, output_path in zip(unique_inputs, output_paths)]
+    if not jobs:
+        console.print("[yellow]No PDF files to process[/yellow]")
+        return
+
+    workers = max(1, workers)
+    if workers == 1:
+        results = ((job[0], _split_one(job)) for job in jobs)
+    else:
+        results = _split_in_pool(jobs, workers)
+
+    failed = 0
+    with make_progress() as progress:
+        task = progress.add_task("Processing files", total=len(jobs))
+        for input_path, error in results:
+            if error is not None:
+                console.print(f"[red]Error processing {input_path}: {error}[/red]")
+                failed += 1
+            progress.update(task, advance=1)
+
+    if failed:
+        raise typer.Exit(1)
+    console.print(f"[green]Successfully processed {len(jobs)} files -> {output_dir}[/green]")
+
 @app.command()
 def main(
-    input_pdf: str = typer.Argument(..., help="Input PDF file path"),
-    output_pdf: str = typer.Argument(..., help="Output PDF file path"),
+    input_pdfs: List[str] = typer.Argument(..., help="Input PDF file paths and/or directories of PDFs"),
+    output_pdf: str = typer.Argument(..., help="Output PDF file path, or output directory when splitting several files or a directory"),
+    workers: int = typer.Option(DEFAULT_WORKERS, "--workers", "-w", help="Number of worker processes when splitting several files; 1 splits the files in this process"),
+    compress_streams: bool = typer.Option(True, "--compress-streams/--no-compress-streams", help="Compress uncompressed streams on write; disable for a faster write and a larger file"),
 ) -> None:
     """
     Split PDF pages into left and right halves while preserving annotations.
@@ -186,18 +492,34 @@ def main(
     This is useful for scanned books where each page contains two real pages.
     The script will create a new PDF with twice as many pages, splitting each
     original page into left and right halves.
+    
+    Given several inputs, or a directory, every PDF is split in parallel and
+    written to the output directory with a "split_" prefix.
     """
-    # Validate input path
-    if not os.path.exists(input_pdf):
-        console.print(f"[red]Error: Input file {input_pdf} does not exist[/red]")
-        raise typer.Exit(1)
+    # Validate input paths
+    for input_pdf in input_pdfs:
+        if not os.path.exists(input_pdf):
+            console.print(f"[red]Error: Input file {input_pdf} does not exist[/red]")
+            raise typer.Exit(1)
+    
+    if len(input_pdfs) > 1 or os.path.isdir(input_pdfs[0]):
+        inputs = []
+        for input_pdf in input_pdfs:
+            if os.path.isdir(input_pdf):
+                inputs.extend(sorted(Path(input_pdf).glob("*.pdf")))
+            else:
+                inputs.append(Path(input_pdf))
+        split_pdfs(inputs, Path(output_pdf), workers, compress_streams)
+        return
+    
+    input_pdf = input_pdfs[0]
     
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(output_pdf)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    process_pdf(input_pdf, output_pdf)
+    process_pdf(input_pdf, output_pdf, compress_streams)
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pikepdf
+
+import pdf_splitr
+
+
+def make_pdf(path: Path, pages: int = 1) -> Path:
+    """Write a small PDF with the given number of blank pages."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pdf = pikepdf.new()
+    for _ in range(pages):
+        pdf.add_blank_page(page_size=(800, 600))
+    pdf.save(path)
+    return path
+
+
+def test_output_paths_are_unique_for_shared_file_names():
+    inputs = [Path("x1/a.pdf"), Path("x2/a.pdf"), Path("b.pdf"), Path("y/x1/a.pdf")]
+    output_paths = pdf_splitr.get_output_paths(inputs, Path("out"))
+
+    assert len(set(output_paths)) == len(inputs)
+    assert output_paths[:3] == [Path("out/split_x1_a.pdf"), Path("out/split_x2_a.pdf"), Path("out/split_b.pdf")]
+
+
+def test_split_pdfs_keeps_files_with_the_same_name_apart(tmp_path):
+    first = make_pdf(tmp_path / "x1" / "a.pdf", pages=1)
+    second = make_pdf(tmp_path / "x2" / "a.pdf", pages=3)
+    out = tmp_path / "out"
+
+    pdf_splitr.split_pdfs([first, second], out, workers=1)
+
+    outputs = sorted(out.iterdir())
+    assert [p.name for p in outputs] == ["split_x1_a.pdf", "split_x2_a.pdf"]
+    with pikepdf.open(outputs[0]) as split_first, pikepdf.open(outputs[1]) as split_second:
+        assert len(split_first.pages) == 2
+        assert len(split_second.pages) == 6
+
+
+def test_annotation_crossing_the_split_is_not_shared(tmp_path):
+    source = tmp_path / "cross.pdf"
+    pdf = pikepdf.new()
+    pdf.add_blank_page(page_size=(800, 600))
+    page = pdf.pages[0]
+    annot = pdf.make_indirect(pikepdf.Dictionary(
+        Type=pikepdf.Name.Annot, Subtype=pikepdf.Name.Square,
+        Rect=pikepdf.Array([390, 10, 410, 30]), P=page.obj,
+    ))
+    page.obj.Annots = pikepdf.Array([annot])
+    pdf.save(source)
+
+    output = tmp_path / "split.pdf"
+    pdf_splitr.PDFProcessor(source, output).process_pdf(quiet=True)
+
+    with pikepdf.open(output) as split:
+        left, right = split.pages
+        left_annot = left.obj.Annots[0]
+        right_annot = right.obj.Annots[0]
+        assert left_annot.objgen != right_annot.objgen
+        assert left_annot.P.objgen == left.obj.objgen
+        assert right_annot.P.objgen == right.obj.objgen
+
+
+def test_split_can_overwrite_its_input(tmp_path):
+    path = make_pdf(tmp_path / "book.pdf", pages=2)
+
+    pdf_splitr.PDFProcessor(path, path).process_pdf(quiet=True)
+
+    with pikepdf.open(path) as split:
+        assert len(split.pages) == 4
+
+
+def test_split_one_reports_exceptions_without_a_message(tmp_path, monkeypatch):
+    def fail(self, quiet=False):
+        raise KeyError()
+
+    monkeypatch.setattr(pdf_splitr.PDFProcessor, "process_pdf", fail)
+
+    error = pdf_splitr._split_one((tmp_path / "a.pdf", tmp_path / "out" / "split_a.pdf", True))
+
+    assert error == "KeyError"